@@ -5,10 +5,14 @@ PeteOllama V1 - AI Model Manager
 Manages interactions with the Ollama AI model for property management responses.
 """
 
+import asyncio
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import os
-from typing import Dict, List, Optional, Any, Iterable
+import re
+import time
+from typing import Dict, List, Optional, Any, Iterable, Iterator, AsyncIterator, Tuple
 from pathlib import Path
 import sys
 
@@ -41,6 +45,9 @@ except ImportError:
     sys.path.insert(0, str(Path(__file__).parent))
     from response_cache import get_instant_response, response_cache
 
+# Sentence boundaries for the simulated token streams
+_SENTENCE_END = re.compile(r'(?<=[.!?])\s+')
+
 class ModelManager:
     """Manages AI model interactions and training"""
     
@@ -49,6 +56,10 @@ class ModelManager:
         # Ollama server configuration
         self.ollama_host = os.getenv('OLLAMA_HOST', 'localhost:11434')
         self.base_url = f"http://{self.ollama_host}"
+        # One pooled session for every Ollama call, so keep-alive connections are reused across
+        # requests (including agenerate_response's worker threads) instead of reconnecting each time
+        self.http = requests.Session()
+        self.http.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=32))
 
         # Load model settings
         self.settings_file = Path("config/model_settings.json")
@@ -85,6 +96,10 @@ class ModelManager:
         self.openrouter_handler = None  # Lazy load
         self._current_provider = None  # Cache for current provider
     
+    def close(self):
+        """Release the pooled Ollama connections"""
+        self.http.close()
+    
     def _get_similarity_analyzer(self):
         """Lazy load the conversation similarity analyzer"""
         if self.similarity_analyzer is None:
@@ -203,7 +218,7 @@ class ModelManager:
         try:
             model_to_use = model_name or self.model_name
             
-            response = requests.post(
+            response = self.http.post(
                 f"{self.base_url}/api/generate",
                 json={
                     "model": model_to_use,
@@ -255,7 +270,7 @@ class ModelManager:
                 print(f"RunPod proxy check failed: {proxy_error}")
                 
             # Fallback to checking Ollama service
-            response = requests.get(f"{self.base_url}/api/tags", timeout=5)
+            response = self.http.get(f"{self.base_url}/api/tags", timeout=5)
             return response.status_code == 200
         except Exception as e:
             print(f"Model availability check failed: {e}")
@@ -265,7 +280,7 @@ class ModelManager:
     def list_models(self) -> List[Dict[str, Any]]:
         """List available models"""
         try:
-            response = requests.get(f"{self.base_url}/api/tags")
+            response = self.http.get(f"{self.base_url}/api/tags")
             if response.status_code == 200:
                 return response.json().get('models', [])
             return []
@@ -305,22 +320,22 @@ class ModelManager:
             model_name = self.custom_model_name
         
         try:
-            response = requests.post(
+            # Closed on exit so an early return hands the connection back to the pool
+            with self.http.post(
                 f"{self.base_url}/api/pull",
                 json={"name": model_name},
                 stream=True
-            )
-            
-            # Stream the response for progress updates
-            for line in response.iter_lines():
-                if line:
-                    data = json.loads(line)
-                    if 'status' in data:
-                        print(f"Model pull: {data['status']}")
-                        if data.get('completed'):
-                            return True
-            
-            return response.status_code == 200
+            ) as response:
+                # Stream the response for progress updates
+                for line in response.iter_lines():
+                    if line:
+                        data = json.loads(line)
+                        if 'status' in data:
+                            print(f"Model pull: {data['status']}")
+                            if data.get('completed'):
+                                return True
+                
+                return response.status_code == 200
         
         except Exception as e:
             print(f"Error pulling model {model_name}: {e}")
@@ -427,6 +442,15 @@ class ModelManager:
         except Exception as e:
             return f"❌ Error: {str(e)}"
 
+    async def agenerate_response(self, prompt: str, context: str = None, model_name: str | None = None) -> str:
+        """generate_response() for async callers, run on a worker thread.
+        
+        The similarity lookup and the provider clients are synchronous, so this keeps them off
+        the event loop and lets concurrent webhook calls overlap instead of queueing behind
+        each other. Throughput is then bounded by the Ollama daemon's OLLAMA_NUM_PARALLEL.
+        """
+        return await asyncio.to_thread(self.generate_response, prompt, context, model_name)
+
     def generate_stream(self, prompt: str, context: str = None, model_name: str | None = None) -> Iterable[str]:
         """Stream AI response using provider-based routing with simulated streaming"""
         try:
@@ -452,34 +476,9 @@ class ModelManager:
                 
                 print(f"✅ {actual_provider.upper()} response: {response_text[:100]}...")
                 
-                # Enhanced streaming simulation with natural pacing
-                import time
-                import re
-                
-                # Split by sentences for more natural streaming
-                sentences = re.split(r'(?<=[.!?])\s+', response_text)
-                
-                for i, sentence in enumerate(sentences):
-                    if sentence.strip():
-                        # Stream each sentence word by word
-                        words = sentence.split()
-                        for j, word in enumerate(words):
-                            if i == 0 and j == 0:
-                                yield word
-                            else:
-                                yield " " + word
-                            
-                            # Faster streaming with minimal delays
-                            if word.endswith(('.', '!', '?')):
-                                time.sleep(0.08)  # Reduced sentence pause
-                            elif word.endswith((',', ';')):
-                                time.sleep(0.05)  # Reduced comma pause  
-                            else:
-                                time.sleep(0.02)  # Faster word delay
-                        
-                        # Small pause between sentences
-                        if i < len(sentences) - 1:
-                            time.sleep(0.1)
+                for word, pause in self._paced_words(response_text):
+                    yield word
+                    time.sleep(pause)
             else:
                 yield f"❌ {provider.upper()} Error: {result.get('error', 'Unknown error')}"
                 
@@ -487,6 +486,68 @@ class ModelManager:
             yield f"❌ Error: {str(e)}"
             return
     
+    async def agenerate_stream(self, prompt: str, context: str = None, model_name: str | None = None) -> AsyncIterator[str]:
+        """generate_stream() for async callers.
+        
+        Only the provider call runs on a worker thread; the words are paced with asyncio.sleep,
+        so a stream holds no thread while it is being written out and each token goes straight
+        from the event loop to the response.
+        """
+        try:
+            full_prompt = self._prepare_prompt(prompt, context)
+            model_to_use = model_name or "llama3:latest"
+            
+            provider = self._get_current_provider()
+            print(f"🚀 ModelManager streaming via {provider.upper()}: {model_to_use}")
+            
+            yield "[Thinking...]"
+            
+            result = await asyncio.to_thread(
+                self._route_to_provider, full_prompt, model_to_use, max_tokens=2048, temperature=0.7
+            )
+            
+            yield "\b" * 13 + " " * 13 + "\b" * 13  # Clear "[Thinking...]"
+            
+            if result.get('status') == 'success':
+                response_text = result.get('response', 'No response generated.')
+                actual_provider = result.get('provider', provider)
+                
+                print(f"✅ {actual_provider.upper()} response: {response_text[:100]}...")
+                
+                for word, pause in self._paced_words(response_text):
+                    yield word
+                    await asyncio.sleep(pause)
+            else:
+                yield f"❌ {provider.upper()} Error: {result.get('error', 'Unknown error')}"
+        
+        except Exception as e:
+            yield f"❌ Error: {str(e)}"
+    
+    @staticmethod
+    def _paced_words(response_text: str) -> Iterator[Tuple[str, float]]:
+        """Split a response into streamed words, each with the pause to take after it.
+        
+        Sentences are streamed word by word with short pauses after punctuation, and a
+        longer one between sentences, for natural-feeling pacing.
+        """
+        sentences = _SENTENCE_END.split(response_text)
+        last_sentence = len(sentences) - 1
+        first = True
+        for i, sentence in enumerate(sentences):
+            words = sentence.split()
+            for j, word in enumerate(words):
+                if word.endswith(('.', '!', '?')):
+                    pause = 0.08
+                elif word.endswith((',', ';')):
+                    pause = 0.05
+                else:
+                    pause = 0.02
+                # Small pause between sentences
+                if j == len(words) - 1 and i < last_sentence:
+                    pause += 0.1
+                yield (word if first else " " + word), pause
+                first = False
+    
     def _prepare_prompt(self, user_prompt: str, context: str = None) -> str:
         """Prepare the full prompt with property management context"""
         
@@ -526,7 +587,7 @@ Key guidelines:
                 f.write(modelfile_content)
             
             # Create model using Ollama API
-            response = requests.post(
+            response = self.http.post(
                 f"{self.base_url}/api/create",
                 json={
                     "name": self.custom_model_name,
@@ -605,7 +666,7 @@ TEMPLATE \"\"\"{{ if .System }}{{.System}}
             model_name = self.model_name
         
         try:
-            response = requests.post(
+            response = self.http.post(
                 f"{self.base_url}/api/show",
                 json={"name": model_name}
             )
@@ -2,43 +2,103 @@
 Model Preloader for keeping Ollama models warm in memory.
 """
 import asyncio
+import os
 import subprocess
 import time
-from typing import Dict, Set, List
+from typing import Dict, Set, List, Optional, Tuple
 from loguru import logger
+import requests
 import threading
 from concurrent.futures import ThreadPoolExecutor
 
 class OllamaModelPreloader:
     """Manages preloading and keeping Ollama models warm in memory."""
     
+    # How long a get_all_models_status() snapshot is reused before re-probing ollama
+    STATUS_TTL_SECONDS = 0.25
+    # How long one `ollama ps` probe answers get_model_info() for request bursts
+    PS_TTL_SECONDS = 2.0
+    
     def __init__(self):
         self.loaded_models: Set[str] = set()
         self.model_load_times: Dict[str, float] = {}
         self.preload_lock = threading.Lock()
+        # Signalled (under preload_lock) whenever a concurrent warmup load finishes
+        self._loads_done = threading.Condition(self.preload_lock)
+        self._loads_in_flight = 0
+        # One lock per model, so warmups of different models can load at the same time
+        self._model_locks: Dict[str, threading.Lock] = {}
+        self.base_url = f"http://{os.getenv('OLLAMA_HOST', 'localhost:11434')}"
+        self.keep_alive = os.getenv("OLLAMA_KEEP_ALIVE", "30m")
+        # Pooled keep-alive connections to the daemon, shared by every preload
+        self.http = requests.Session()
+        self.http.mount("http://", requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=8))
         self.executor = ThreadPoolExecutor(max_workers=2)
         self._shutdown = False
+        # (loop, event) pairs for status streams waiting on load/unload changes
+        self._status_listeners: Set[tuple] = set()
+        self._listeners_lock = threading.Lock()
+        # (monotonic time, snapshot) for get_all_models_status
+        self._status_cache: Tuple[float, Optional[List[Dict]]] = (0.0, None)
+        self._status_lock = threading.Lock()
+        # (monotonic time, `ollama ps` output) shared by get_model_info callers
+        self._ps_cache: Tuple[float, Optional[str]] = (0.0, None)
+    
+    def subscribe_status(self) -> asyncio.Event:
+        """Return an event that is set whenever a model is loaded or unloaded.
         
-    def is_model_loaded(self, model_name: str) -> bool:
-        """Check if a model is currently loaded in memory."""
+        Must be called from a running event loop; release it with unsubscribe_status.
+        """
+        event = asyncio.Event()
+        with self._listeners_lock:
+            self._status_listeners.add((asyncio.get_running_loop(), event))
+        return event
+    
+    def unsubscribe_status(self, event: asyncio.Event) -> None:
+        """Stop notifying an event returned by subscribe_status."""
+        with self._listeners_lock:
+            self._status_listeners = {pair for pair in self._status_listeners if pair[1] is not event}
+    
+    def _notify_status_change(self) -> None:
+        """Drop the status snapshot and wake every subscriber (safe to call from worker threads)."""
+        self._status_cache = (0.0, None)
+        self._ps_cache = (0.0, None)
+        with self._listeners_lock:
+            listeners = list(self._status_listeners)
+        for loop, event in listeners:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                pass  # subscriber's loop already closed
+        
+    def _running_models_output(self) -> str:
+        """Return `ollama ps` output, or "" if it could not be read."""
         try:
-            # Check if model process is running
             result = subprocess.run([
                 "ollama", "ps"
             ], capture_output=True, text=True, timeout=10)
             
             if result.returncode == 0:
-                # Look for the model in the running processes
-                return model_name in result.stdout
+                return result.stdout
             
-            return False
+            return ""
         except Exception as e:
             logger.warning(f"Could not check model status: {e}")
-            return False
+            return ""
+    
+    def is_model_loaded(self, model_name: str) -> bool:
+        """Check if a model is currently loaded in memory."""
+        # Look for the model in the running processes
+        return model_name in self._running_models_output()
     
     def preload_model(self, model_name: str, unload_others: bool = True) -> bool:
         """
-        Preload a model into memory using a lightweight prompt.
+        Preload a model into memory with an empty-prompt generate request.
+        
+        With unload_others the unload and the load run as one step under preload_lock, after
+        any in-flight warmups finish, so only model_name is left loaded. Without it (startup
+        warmup), loads of different models may run concurrently; loads of the same model
+        are serialized.
         
         Args:
             model_name: The model to preload
@@ -47,43 +107,68 @@ class OllamaModelPreloader:
         Returns:
             True if successful, False otherwise.
         """
-        with self.preload_lock:
-            # Unload other models first if requested
-            if unload_others and self.loaded_models:
+        if unload_others:
+            with self._loads_done:
+                self._loads_done.wait_for(lambda: self._loads_in_flight == 0)
                 for loaded_model in list(self.loaded_models):
                     if loaded_model != model_name:
                         self.unload_model(loaded_model)
-            
+                
+                if model_name in self.loaded_models:
+                    logger.info(f"Model {model_name} already loaded")
+                    return True
+                return self._load_model(model_name)
+        
+        with self.preload_lock:
             if model_name in self.loaded_models:
                 logger.info(f"Model {model_name} already loaded")
                 return True
-            
-            try:
-                logger.info(f"🔄 Preloading model {model_name} into memory...")
-                start_time = time.time()
-                
-                # Use a very simple prompt to load the model
-                result = subprocess.run([
-                    "ollama", "run", model_name, "Hi"
-                ], capture_output=True, text=True, timeout=300)  # 5 min timeout for first load
-                
-                load_time = time.time() - start_time
-                
-                if result.returncode == 0:
-                    self.loaded_models.add(model_name)
-                    self.model_load_times[model_name] = load_time
-                    logger.info(f"✅ Model {model_name} preloaded in {load_time:.2f}s")
+            model_lock = self._model_locks.setdefault(model_name, threading.Lock())
+            self._loads_in_flight += 1
+        
+        try:
+            with model_lock:
+                # Another caller may have finished loading it while we waited
+                if model_name in self.loaded_models:
                     return True
-                else:
-                    logger.error(f"❌ Failed to preload {model_name}: {result.stderr}")
-                    return False
-                    
-            except subprocess.TimeoutExpired:
-                logger.error(f"❌ Timeout preloading {model_name}")
-                return False
-            except Exception as e:
-                logger.error(f"❌ Error preloading {model_name}: {e}")
+                return self._load_model(model_name)
+        finally:
+            with self._loads_done:
+                self._loads_in_flight -= 1
+                self._loads_done.notify_all()
+    
+    def _load_model(self, model_name: str) -> bool:
+        """Ask Ollama to load model_name and record it as loaded."""
+        try:
+            logger.info(f"🔄 Preloading model {model_name} into memory...")
+            start_time = time.time()
+            
+            # An empty prompt makes Ollama load the model without generating anything
+            response = self.http.post(f"{self.base_url}/api/generate", json={
+                "model": model_name,
+                "prompt": "",
+                "keep_alive": self.keep_alive,
+                "stream": False
+            }, timeout=300)  # 5 min timeout for first load
+            
+            load_time = time.time() - start_time
+            
+            if response.status_code == 200:
+                self.loaded_models.add(model_name)
+                self.model_load_times[model_name] = load_time
+                logger.info(f"✅ Model {model_name} preloaded in {load_time:.2f}s")
+                self._notify_status_change()
+                return True
+            else:
+                logger.error(f"❌ Failed to preload {model_name}: {response.text}")
                 return False
+                
+        except requests.Timeout:
+            logger.error(f"❌ Timeout preloading {model_name}")
+            return False
+        except Exception as e:
+            logger.error(f"❌ Error preloading {model_name}: {e}")
+            return False
     
     def unload_model(self, model_name: str) -> bool:
         """
@@ -104,6 +189,7 @@ class OllamaModelPreloader:
             if result.returncode == 0:
                 self.loaded_models.discard(model_name)
                 logger.info(f"🗑️ Model {model_name} unloaded from memory")
+                self._notify_status_change()
                 return True
             else:
                 logger.warning(f"⚠️ Could not unload {model_name}: {result.stderr}")
@@ -144,13 +230,27 @@ class OllamaModelPreloader:
         
         return results
     
-    def get_model_info(self, model_name: str) -> Dict:
-        """Get information about a model's load status and performance."""
+    def _recent_running_models_output(self) -> str:
+        """`ollama ps` output, reused for PS_TTL_SECONDS; loads and unloads invalidate it."""
+        probed_at, output = self._ps_cache
+        if output is None or time.monotonic() - probed_at >= self.PS_TTL_SECONDS:
+            output = self._running_models_output()
+            self._ps_cache = (time.monotonic(), output)
+        return output
+    
+    def get_model_info(self, model_name: str, ps_output: Optional[str] = None) -> Dict:
+        """Get information about a model's load status and performance.
+        
+        Pass ps_output to reuse one `ollama ps` probe across several models; otherwise
+        a probe up to PS_TTL_SECONDS old is used.
+        """
+        if ps_output is None:
+            ps_output = self._recent_running_models_output()
         return {
             "name": model_name,
             "loaded": model_name in self.loaded_models,
             "load_time": self.model_load_times.get(model_name, 0),
-            "is_running": self.is_model_loaded(model_name),
+            "is_running": model_name in ps_output,
             "base_model": self._get_base_model(model_name)
         }
     
@@ -164,16 +264,33 @@ class OllamaModelPreloader:
             return "unknown"
     
     def get_all_models_status(self) -> List[Dict]:
-        """Get status of all known models."""
-        known_models = [
-            "peteollama:jamie-fixed",
-            "peteollama:jamie-simple", 
-            "peteollama:jamie-voice-complete",
-            "peteollama:jamie-working-working_20250806",
-            "llama3:latest"
-        ]
+        """Get status of all known models.
+        
+        The snapshot is shared for STATUS_TTL_SECONDS so concurrent viewers don't each
+        shell out to ollama; loads and unloads invalidate it immediately.
+        """
+        cached_at, cached = self._status_cache
+        if cached is not None and time.monotonic() - cached_at < self.STATUS_TTL_SECONDS:
+            return cached
         
-        return [self.get_model_info(model) for model in known_models]
+        with self._status_lock:
+            # Another thread may have refreshed the snapshot while we waited
+            cached_at, cached = self._status_cache
+            if cached is not None and time.monotonic() - cached_at < self.STATUS_TTL_SECONDS:
+                return cached
+            
+            known_models = [
+                "peteollama:jamie-fixed",
+                "peteollama:jamie-simple", 
+                "peteollama:jamie-voice-complete",
+                "peteollama:jamie-working-working_20250806",
+                "llama3:latest"
+            ]
+            
+            ps_output = self._running_models_output()
+            status = [self.get_model_info(model, ps_output) for model in known_models]
+            self._status_cache = (time.monotonic(), status)
+            return status
     
     def keep_warm(self, model_name: str, interval_minutes: int = 30):
         """
@@ -2,7 +2,7 @@
 Pydantic models for benchmark analytics and data validation
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, computed_field
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 import pendulum
@@ -108,6 +108,7 @@ class ModelComparison(BaseModel):
     base_model: str = Field(default="unknown", description="Base model (llama3, qwen, etc.)")
     preload_rate: float = Field(default=0.0, description="Percentage of requests with preloaded model")
     
+    @computed_field
     @property
     def performance_grade(self) -> str:
         """Overall performance grade A-F"""
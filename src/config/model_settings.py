@@ -52,6 +52,8 @@ class ModelSettingsManager:
         self.settings_file = Path(settings_file)
         self.settings_file.parent.mkdir(exist_ok=True)
         self.models: Dict[str, ModelConfig] = {}
+        # Bumped whenever model configs change so callers can cache derived views
+        self.version = 0
         self.load_settings()
         self._init_default_models()
     
@@ -71,6 +73,7 @@ class ModelSettingsManager:
                         except Exception as e:
                             logger.warning(f"Skipping invalid model config for {name}: {e}")
                             continue
+                self.version += 1
                 logger.info(f"Loaded settings for {len(self.models)} models")
             else:
                 logger.info("No existing model settings found, will create defaults")
@@ -89,6 +92,7 @@ class ModelSettingsManager:
             with open(self.settings_file, 'w') as f:
                 json.dump(data, f, indent=2)
             
+            self.version += 1
             logger.info(f"Saved settings for {len(self.models)} models")
             return True
         except Exception as e:
@@ -263,6 +267,7 @@ class ModelSettingsManager:
                 "models": {name: asdict(config) for name, config in self.models.items()},
                 "default_model": getattr(self, 'default_model', None)
             }
+            before = {name: self._comparable(config) for name, config in self.models.items()}
             
             # Sync with discovered models
             synced_config = enhanced_discovery.sync_with_existing_config(
@@ -285,8 +290,11 @@ class ModelSettingsManager:
             if synced_config.get("default_model"):
                 self.default_model = synced_config["default_model"]
             
-            # Save updated settings
-            self.save_settings()
+            # Save updated settings only when something actually changed, so
+            # repeated refreshes don't invalidate caches keyed on self.version
+            after = {name: self._comparable(config) for name, config in self.models.items()}
+            if after != before:
+                self.save_settings()
             
             logger.info(f"Synced {len(discovered_models)} discovered models with configuration")
             return True
@@ -295,6 +303,14 @@ class ModelSettingsManager:
             logger.error(f"Error syncing with discovered models: {e}")
             return False
     
+    @staticmethod
+    def _comparable(config: ModelConfig) -> Dict[str, Any]:
+        """Config fields minus timestamps, for change detection"""
+        data = asdict(config)
+        data.pop('created_at', None)
+        data.pop('last_updated', None)
+        return data
+    
     def refresh_from_ollama(self) -> bool:
         """Refresh model list from ollama list command"""
         return self.sync_with_discovered_models()
@@ -7,6 +7,7 @@ Simple SQLite interface for accessing training data from pete.db
 
 import sqlite3
 import os
+import threading
 from typing import Dict, List, Optional, Any
 from pathlib import Path
 
@@ -26,7 +27,9 @@ class PeteDBManager:
         else:
             self.db_path = Path(db_path)
         
-        self._connection = None
+        # sqlite3 connections may only be used by the thread that opened them, so each
+        # thread (event loop, threadpool workers) gets its own
+        self._local = threading.local()
     
     def _find_pete_db(self) -> str:
         """Find existing pete.db file in common locations"""
@@ -50,11 +53,15 @@ class PeteDBManager:
         return os.path.join(os.getcwd(), "pete.db")
     
     def get_connection(self) -> sqlite3.Connection:
-        """Get database connection (create if needed)"""
-        if self._connection is None:
-            self._connection = sqlite3.connect(str(self.db_path))
-            self._connection.row_factory = sqlite3.Row  # Enable dict-like access
-        return self._connection
+        """Get this thread's database connection (create if needed)"""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(str(self.db_path))
+            connection.row_factory = sqlite3.Row  # Enable dict-like access
+            # This manager only reads pete.db; let SQLite skip write-intent locking
+            connection.execute("PRAGMA query_only = ON")
+            self._local.connection = connection
+        return connection
     
     def is_connected(self) -> bool:
         """Check if database is accessible"""
@@ -203,20 +210,42 @@ class PeteDBManager:
             print(f"Error searching conversations: {e}")
             return []
     
-    def get_training_examples(self, category: str = None) -> List[Dict[str, str]]:
-        """Get training examples for model fine-tuning"""
+    def recent_conversation_dates(self, query: str, limit: int = 3) -> List[str]:
+        """Dates of the newest conversations mentioning `query` (e.g. a caller's phone number).
+        
+        A lighter search_conversations() for per-call lookups: only CreationDate is read and
+        returned, with no per-row dict. The SQL text is constant, so the connection's statement
+        cache reuses the prepared statement.
+        """
+        try:
+            rows = self.get_connection().execute("""
+                SELECT CreationDate
+                FROM communication_logs 
+                WHERE Transcription LIKE ? 
+                ORDER BY CreationDate DESC 
+                LIMIT ?
+            """, (f"%{query}%", limit)).fetchall()
+            return [row[0] for row in rows]
+        
+        except Exception as e:
+            print(f"Error searching conversation dates: {e}")
+            return []
+    
+    def get_training_examples(self, category: str = None, limit: Optional[int] = None) -> List[Dict[str, str]]:
+        """Get training examples for model fine-tuning (newest first, at most `limit` rows)"""
         try:
             conn = self.get_connection()
             cursor = conn.cursor()
             
-            # Get conversations with good transcriptions
+            # Get conversations with good transcriptions (SQLite treats LIMIT -1 as no limit)
             cursor.execute("""
                 SELECT Transcription, Data
                 FROM communication_logs 
                 WHERE Transcription IS NOT NULL 
                 AND LENGTH(Transcription) > 50
                 ORDER BY CreationDate DESC
-            """)
+                LIMIT ?
+            """, (-1 if limit is None else limit,))
             
             examples = []
             for row in cursor.fetchall():
@@ -233,7 +262,8 @@ class PeteDBManager:
             return []
     
     def close(self):
-        """Close database connection"""
-        if self._connection:
-            self._connection.close()
-            self._connection = None
\ No newline at end of file
+        """Close this thread's database connection"""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
\ No newline at end of file
@@ -0,0 +1,391 @@
+// Benchmarks dashboard (/admin/benchmarks): filters, summary cards, model comparison,
+// the virtualized recent-data table and the response-time histogram.
+
+let currentData = null;
+
+// Load initial data - inlined by the server when available, fetched otherwise
+document.addEventListener('DOMContentLoaded', function() {
+    const init = document.getElementById('__INIT__');
+    if (init && filtersAtDefault()) {
+        showBenchmarkData(JSON.parse(init.textContent));
+    } else {
+        loadBenchmarkData();
+    }
+});
+
+// The inlined __INIT__ data was computed for the default filters; a reload can restore other selections
+function filtersAtDefault() {
+    return [...document.querySelectorAll('select')].every(s => s.selectedIndex < 0 || s.options[s.selectedIndex].defaultSelected);
+}
+
+// Run fn now, then at most once per ms; a call during the wait runs once more at the
+// end, so the last click or filter change always lands
+function debounce(fn, ms) {
+    let timer = null;
+    let pending = false;
+    return () => {
+        if (timer) {
+            pending = true;
+            return;
+        }
+        fn();
+        timer = setTimeout(function flush() {
+            if (pending) {
+                pending = false;
+                fn();
+                timer = setTimeout(flush, ms);
+            } else {
+                timer = null;
+            }
+        }, ms);
+    };
+}
+
+const scheduleBenchmarkLoad = debounce(loadBenchmarkData, 400);
+
+function benchmarkFilterParams() {
+    return new URLSearchParams({
+        date_range: document.getElementById('dateRange').value,
+        model_filter: document.getElementById('modelFilter').value,
+        specific_model: document.getElementById('specificModel').value,
+        quality_threshold: document.getElementById('qualityThreshold').value
+    });
+}
+
+async function loadBenchmarkData() {
+    try {
+        // One request brings the summary, comparisons, recent rows and model list
+        const response = await fetch('/admin/api/dashboard?' + benchmarkFilterParams().toString());
+        showBenchmarkData(await response.json());
+        
+    } catch (error) {
+        console.error('Error loading benchmark data:', error);
+        document.getElementById('summaryMetrics').innerHTML = '<div style="color:red;">Error loading data: ' + error.message + '</div>';
+    }
+}
+
+function showBenchmarkData(data) {
+    currentData = data;
+    
+    updateSummaryMetrics(data.summary);
+    updateModelComparison(data.model_comparisons);
+    updateBenchmarkTable(data.recent_data);
+    drawResponseTimeChart(data.recent_data);
+    
+    // Update specific model dropdown with available models
+    updateModelDropdown(data.available_models || []);
+    
+    // The dashboard only carries the newest rows; the longer history streams in behind it
+    streamBenchmarkRows();
+}
+
+// Longer benchmark history for the table, streamed as NDJSON (newest first) one page at a
+// time; the next page is requested with ?before=<X-Next-Cursor>&before_id=<X-Next-Cursor-Id>
+// as the table nears its end
+const BENCH_PAGE_SIZE = 500;
+const BENCH_STREAM_BATCH = 200;
+const whenIdle = window.requestIdleCallback || (callback => setTimeout(callback, 0));
+let benchStream = null;
+let benchCursor = null;
+
+async function streamBenchmarkRows(before = null, beforeId = null) {
+    if (benchStream) benchStream.abort();
+    const controller = benchStream = new AbortController();
+    const params = benchmarkFilterParams();
+    params.set('limit', BENCH_PAGE_SIZE);
+    if (before) params.set('before', before);
+    if (beforeId !== null) params.set('before_id', beforeId);
+    benchCursor = null;
+    
+    // A first page replaces the dashboard's rows; older pages extend the loaded ones
+    const rows = before ? benchTable.rows : [];
+    let shown = rows.length;
+    const show = () => whenIdle(() => {
+        if (controller.signal.aborted || rows.length === shown) return;
+        shown = rows.length;
+        // The streamed rows start with the ones already on screen, so swapping them in is seamless
+        if (!benchTable.viewport) {
+            updateBenchmarkTable(rows.slice().reverse());
+        } else {
+            benchTable.rows = rows;
+            benchTable.start = benchTable.end = -1;
+            renderBenchmarkWindow();
+        }
+    });
+    
+    try {
+        const response = await fetch('/admin/api/benchmarks/stream?' + params.toString(), {signal: controller.signal});
+        if (!response.ok) return;
+        await readNdjson(response, row => {
+            rows.push(row);
+            if (rows.length % BENCH_STREAM_BATCH === 0) show();
+        });
+        const cursor = response.headers.get('X-Next-Cursor');
+        benchCursor = cursor && {before: cursor, beforeId: response.headers.get('X-Next-Cursor-Id')};
+        show();
+    } catch (error) {
+        if (error.name !== 'AbortError') console.error('Error streaming benchmark rows:', error);
+    } finally {
+        if (benchStream === controller) benchStream = null;
+    }
+}
+
+async function readNdjson(response, onRow) {
+    let pending = '';
+    const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+    while (true) {
+        const {value, done} = await reader.read();
+        if (done) break;
+        pending += value;
+        let nl;
+        while ((nl = pending.indexOf('\n')) >= 0) {
+            const line = pending.slice(0, nl);
+            pending = pending.slice(nl + 1);
+            if (line) onRow(JSON.parse(line));
+        }
+    }
+}
+
+function updateModelDropdown(availableModels) {
+    const specificModelSelect = document.getElementById('specificModel');
+    const currentValue = specificModelSelect.value;
+    
+    // Clear existing options except "All Models"
+    specificModelSelect.innerHTML = '<option value="all" selected>All Models</option>';
+    
+    // Add available models
+    availableModels.forEach(model => {
+        const option = document.createElement('option');
+        option.value = model;
+        option.textContent = model;
+        if (model === currentValue) {
+            option.selected = true;
+        }
+        specificModelSelect.appendChild(option);
+    });
+}
+
+function updateSummaryMetrics(summary) {
+    const cards = [
+        ['Total Requests', summary.total_requests],
+        ['Avg Response Time', `${summary.avg_response_time_ms}ms`],
+        ['Success Rate', `${summary.success_rate.toFixed(1)}%`],
+        ['Avg Quality Score', `${summary.avg_quality_score.toFixed(1)}/10`],
+        ['Fast Responses (<3s)', summary.fast_responses_count],
+        ['Models Tested', summary.models_tested.length]
+    ];
+    const tpl = document.getElementById('metricCardTpl').content.firstElementChild;
+    document.getElementById('summaryMetrics').replaceChildren(...cards.map(([label, value]) => {
+        const card = tpl.cloneNode(true);
+        card.querySelector('.metric-value').textContent = value;
+        card.querySelector('.metric-label').textContent = label;
+        return card;
+    }));
+}
+
+function updateModelComparison(comparisons) {
+    if (!comparisons || comparisons.length === 0) {
+        document.getElementById('modelComparison').innerHTML = '<p>No model comparison data available.</p>';
+        return;
+    }
+    
+    // Clone the table and its rows from templates and attach them in one go
+    const table = document.getElementById('comparisonTableTpl').content.firstElementChild.cloneNode(true);
+    const rowTpl = document.getElementById('comparisonRowTpl').content.firstElementChild;
+    const frag = document.createDocumentFragment();
+    
+    comparisons.forEach(comp => {
+        const row = rowTpl.cloneNode(true);
+        const time = row.querySelector('.time');
+        time.classList.add(comp.avg_response_time_ms < 2000 ? 'fast' : (comp.avg_response_time_ms < 5000 ? 'medium' : 'slow'));
+        time.textContent = `${comp.avg_response_time_ms.toFixed(0)}ms`;
+        row.querySelector('.model').textContent = comp.model_name;
+        row.querySelector('.requests').textContent = comp.request_count;
+        row.querySelector('.success').textContent = `${comp.success_rate.toFixed(1)}%`;
+        row.querySelector('.quality').textContent = `${comp.avg_quality_score.toFixed(1)}/10`;
+        row.querySelector('.fast').textContent = `${comp.fast_response_rate.toFixed(1)}%`;
+        row.querySelector('.grade').textContent = comp.performance_grade;
+        row.querySelector('.recommendation').textContent = comp.recommendation;
+        frag.appendChild(row);
+    });
+    
+    table.tBodies[0].appendChild(frag);
+    document.getElementById('modelComparison').replaceChildren(table);
+}
+
+// The recent-data table only renders the rows in view; spacer rows stand in for the rest
+const BENCH_ROW_HEIGHT = 32;
+const BENCH_OVERSCAN = 10;
+const benchTable = {rows: [], viewport: null, tbody: null, start: -1, end: -1, frame: 0};
+
+function updateBenchmarkTable(recentData) {
+    const container = document.getElementById('benchmarkTable');
+    if (!recentData || recentData.length === 0) {
+        benchTable.viewport = null;
+        container.innerHTML = '<p>No recent benchmark data available.</p>';
+        return;
+    }
+    
+    if (!benchTable.viewport) {
+        container.classList.remove('loading');
+        container.innerHTML = `
+            <div id="benchTableViewport" class="bench-viewport">
+                <table class="benchmark-table">
+                    <thead>
+                        <tr>
+                            <th>Time</th>
+                            <th>Model</th>
+                            <th>Message</th>
+                            <th>Response Time</th>
+                            <th>Quality</th>
+                            <th>Status</th>
+                            <th>Source</th>
+                        </tr>
+                    </thead>
+                    <tbody></tbody>
+                </table>
+            </div>
+        `;
+        benchTable.viewport = document.getElementById('benchTableViewport');
+        benchTable.tbody = benchTable.viewport.querySelector('tbody');
+        benchTable.viewport.addEventListener('scroll', () => {
+            if (!benchTable.frame) benchTable.frame = requestAnimationFrame(renderBenchmarkWindow);
+        }, {passive: true});
+    }
+    
+    // Newest first
+    benchTable.rows = recentData.slice().reverse();
+    benchTable.start = benchTable.end = -1;
+    benchTable.viewport.scrollTop = 0;
+    renderBenchmarkWindow();
+}
+
+function renderBenchmarkWindow() {
+    benchTable.frame = 0;
+    const {rows, viewport, tbody} = benchTable;
+    const headerHeight = tbody.offsetTop;
+    const first = Math.max(0, Math.floor((viewport.scrollTop - headerHeight) / BENCH_ROW_HEIGHT) - BENCH_OVERSCAN);
+    const visible = Math.ceil((viewport.clientHeight || 600) / BENCH_ROW_HEIGHT);
+    const last = Math.min(rows.length, first + visible + 2 * BENCH_OVERSCAN);
+    if (last >= rows.length - BENCH_OVERSCAN && benchCursor && !benchStream) {
+        streamBenchmarkRows(benchCursor.before, benchCursor.beforeId);
+    }
+    if (first === benchTable.start && last === benchTable.end) return;
+    benchTable.start = first;
+    benchTable.end = last;
+    
+    const items = [];
+    if (first > 0) items.push(benchSpacer(first));
+    for (let i = first; i < last; i++) items.push(benchmarkRow(rows[i]));
+    if (last < rows.length) items.push(benchSpacer(rows.length - last));
+    tbody.replaceChildren(...items);
+}
+
+function benchSpacer(rowCount) {
+    const tr = document.createElement('tr');
+    tr.style.height = (rowCount * BENCH_ROW_HEIGHT) + 'px';
+    return tr;
+}
+
+function benchmarkRow(record) {
+    const responseTime = record.perf_total_duration_ms;
+    const cells = [
+        [new Date(record.timestamp).toLocaleTimeString()],
+        [record.model],
+        [record.user_message.substring(0, 30) + '...'],
+        [responseTime + 'ms', responseTime < 2000 ? 'fast' : (responseTime < 5000 ? 'medium' : 'slow')],
+        [record.quality_estimated_quality_score.toFixed(1) + '/10'],
+        [record.status, record.status === 'success' ? 'status-success' : 'status-error'],
+        [record.source]
+    ];
+    const tr = document.createElement('tr');
+    for (const [text, className] of cells) {
+        const td = document.createElement('td');
+        td.textContent = text;
+        if (className) td.className = className;
+        tr.appendChild(td);
+    }
+    tr.children[2].title = record.user_message;
+    return tr;
+}
+
+// Binning runs in a worker; only the latest request's result is drawn.
+// /public is served as immutable, so bump ?v= when the worker changes.
+const HISTOGRAM_BINS = 10;
+let histogramWorker = null;
+let histogramRequest = 0;
+
+function drawResponseTimeChart(data) {
+    // Simple canvas-based chart (you could replace with Chart.js for more advanced charts)
+    const canvas = document.getElementById('responseTimeChart');
+    const ctx = canvas.getContext('2d');
+    
+    // Clear canvas
+    ctx.clearRect(0, 0, canvas.width, canvas.height);
+    
+    const responseTimes = (data || []).map(d => d.perf_total_duration_ms).filter(t => t > 0);
+    if (responseTimes.length === 0) {
+        ctx.fillStyle = '#666';
+        ctx.font = '16px Arial';
+        ctx.textAlign = 'center';
+        ctx.fillText('No data available for chart', canvas.width / 2, canvas.height / 2);
+        return;
+    }
+    
+    if (!histogramWorker) {
+        histogramWorker = new Worker('/public/js/histogram-worker.js?v=1');
+        histogramWorker.onmessage = (e) => {
+            if (e.data.id === histogramRequest) drawHistogram(canvas, e.data);
+        };
+    }
+    histogramWorker.postMessage({id: ++histogramRequest, values: responseTimes, bins: HISTOGRAM_BINS});
+}
+
+function drawHistogram(canvas, {histogram, maxCount, binSize}) {
+    const ctx = canvas.getContext('2d');
+    ctx.clearRect(0, 0, canvas.width, canvas.height);
+    
+    const barWidth = canvas.width / histogram.length;
+    const maxBarHeight = canvas.height - 40;
+    
+    // Draw bars - one path, filled once
+    const bars = new Path2D();
+    histogram.forEach((count, i) => {
+        const barHeight = (count / maxCount) * maxBarHeight;
+        bars.rect(i * barWidth + 2, canvas.height - barHeight - 20, barWidth - 4, barHeight);
+    });
+    ctx.fillStyle = '#007acc';
+    ctx.fill(bars);
+    
+    // Draw labels - text state set once for all of them
+    ctx.fillStyle = '#333';
+    ctx.font = '12px Arial';
+    ctx.textAlign = 'center';
+    histogram.forEach((count, i) => {
+        ctx.fillText(`${Math.round(i * binSize)}-${Math.round((i + 1) * binSize)}ms`, i * barWidth + barWidth / 2, canvas.height - 5);
+    });
+}
+
+function refreshData() {
+    scheduleBenchmarkLoad();
+}
+
+async function exportAnalysis() {
+    if (!currentData) {
+        alert('No data to export');
+        return;
+    }
+    
+    const dataStr = JSON.stringify(currentData, null, 2);
+    const dataBlob = new Blob([dataStr], {type: 'application/json'});
+    const url = URL.createObjectURL(dataBlob);
+    const link = document.createElement('a');
+    link.href = url;
+    link.download = 'benchmark-analysis-' + new Date().toISOString().split('T')[0] + '.json';
+    link.click();
+}
+
+function loadHistoricalData() {
+    // Placeholder for historical data loading
+    alert('Historical data loading feature coming soon!');
+}
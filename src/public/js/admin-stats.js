@@ -0,0 +1,176 @@
+// Stats dashboard (/admin/stats): filters, headline metrics, model comparison and export.
+
+// Last dashboard payload, reused by the export
+let currentStats = null;
+
+// Load initial data - inlined by the server when available, fetched otherwise
+document.addEventListener('DOMContentLoaded', function() {
+    const init = document.getElementById('__INIT__');
+    if (init && filtersAtDefault()) {
+        showStatsData(JSON.parse(init.textContent));
+    } else {
+        loadStatsData();
+    }
+});
+
+// The inlined __INIT__ data was computed for the default filters; a reload can restore other selections
+function filtersAtDefault() {
+    return [...document.querySelectorAll('select')].every(s => s.selectedIndex < 0 || s.options[s.selectedIndex].defaultSelected);
+}
+
+// Run fn now, then at most once per ms; a call during the wait runs once more at the
+// end, so the last click or filter change always lands
+function debounce(fn, ms) {
+    let timer = null;
+    let pending = false;
+    return () => {
+        if (timer) {
+            pending = true;
+            return;
+        }
+        fn();
+        timer = setTimeout(function flush() {
+            if (pending) {
+                pending = false;
+                fn();
+                timer = setTimeout(flush, ms);
+            } else {
+                timer = null;
+            }
+        }, ms);
+    };
+}
+
+const scheduleStatsLoad = debounce(loadStatsData, 400);
+
+async function loadStatsData() {
+    try {
+        // Get filter values
+        const timePeriod = document.getElementById('timePeriod').value;
+        const modelType = document.getElementById('modelType').value;
+        const specificModel = document.getElementById('specificModelStats').value;
+        const performanceFilter = document.getElementById('performanceFilter').value;
+        
+        // Build query parameters
+        const params = new URLSearchParams({
+            date_range: timePeriod,
+            model_filter: modelType,
+            specific_model: specificModel,
+            performance_filter: performanceFilter
+        });
+        
+        // One request brings the metrics, model comparison and model list
+        const response = await fetch('/admin/api/dashboard?' + params.toString());
+        showStatsData(await response.json());
+        
+    } catch (error) {
+        console.error('Error loading stats data:', error);
+        document.getElementById('statsMetrics').innerHTML = '<div style="color:red;">Error loading data: ' + error.message + '</div>';
+    }
+}
+
+function showStatsData(data) {
+    currentStats = data;
+    
+    updateStatsMetrics(data);
+    updateModelComparison(data.model_comparisons || []);
+    updateModelDropdown(data.available_models || []);
+}
+
+function updateStatsMetrics(data) {
+    const statsContainer = document.getElementById('statsMetrics');
+    
+    if (!data || !data.metrics) {
+        statsContainer.innerHTML = '<div style="color:red;">No data available</div>';
+        return;
+    }
+    
+    const metrics = data.metrics;
+    const cards = [
+        ['Training Conversations', metrics.total_conversations || 0, 'From pete.db'],
+        ['Jamie Models', metrics.jamie_models || 0, 'Active variants'],
+        ['Avg Response Time', metrics.avg_response_time || '0s', 'Filtered period'],
+        ['Success Rate', metrics.success_rate || '0%', 'Non-timeout responses']
+    ];
+    const tpl = document.getElementById('statCardTpl').content.firstElementChild;
+    statsContainer.replaceChildren(...cards.map(([label, value, sublabel]) => {
+        const card = tpl.cloneNode(true);
+        card.querySelector('.stat-value').textContent = value;
+        card.querySelector('.stat-label').textContent = label;
+        card.querySelector('.stat-sublabel').textContent = sublabel;
+        return card;
+    }));
+}
+
+function updateModelDropdown(availableModels) {
+    const select = document.getElementById('specificModelStats');
+    const currentValue = select.value;
+    select.innerHTML = '<option value="all">All Models</option>';
+    availableModels.forEach(model => {
+        const option = document.createElement('option');
+        option.value = model;
+        option.textContent = model;
+        select.appendChild(option);
+    });
+    select.value = availableModels.includes(currentValue) ? currentValue : 'all';
+}
+
+function updateModelComparison(comparisons) {
+    const tbody = document.querySelector('#modelComparisonTable tbody');
+    if (comparisons.length === 0) {
+        tbody.innerHTML = '<tr><td colspan="6">No model data for these filters.</td></tr>';
+        return;
+    }
+    // Clone rows from the template into one fragment and swap them in with a single DOM write
+    const rowTpl = document.getElementById('comparisonRowTpl').content.firstElementChild;
+    const frag = document.createDocumentFragment();
+    comparisons.forEach(comp => {
+        const row = rowTpl.cloneNode(true);
+        const time = row.querySelector('.time');
+        time.classList.add(comp.avg_response_time_ms < 3000 ? 'good' : (comp.avg_response_time_ms < 10000 ? 'warning' : 'error'));
+        time.textContent = `${(comp.avg_response_time_ms / 1000).toFixed(1)}s`;
+        row.querySelector('.model').textContent = comp.model_name;
+        row.querySelector('.base').textContent = comp.base_model;
+        row.querySelector('.success').textContent = `${comp.success_rate.toFixed(1)}%`;
+        row.querySelector('.quality').textContent = `${comp.avg_quality_score.toFixed(1)}/10`;
+        row.querySelector('.tests').textContent = `${comp.request_count} tests`;
+        row.querySelector('.status').textContent = `${comp.performance_grade || ''} ${comp.recommendation}`;
+        frag.appendChild(row);
+    });
+    tbody.replaceChildren(frag);
+}
+
+function refreshStats(){
+    document.getElementById('lastUpdate').textContent = new Date().toLocaleString();
+    scheduleStatsLoad();
+}
+
+function exportStats(){
+    // Export what is on screen - the data was loaded with the current filters
+    if (!currentStats) {
+        alert('No stats loaded yet. Please try again.');
+        return;
+    }
+    const statsData = {
+        timestamp: new Date().toISOString(),
+        metrics: currentStats.metrics,
+        model_comparisons: currentStats.model_comparisons,
+        filters: {
+            time_period: document.getElementById('timePeriod').value,
+            model_type: document.getElementById('modelType').value,
+            specific_model: document.getElementById('specificModelStats').value,
+            performance_filter: document.getElementById('performanceFilter').value
+        }
+    };
+    
+    const dataStr = JSON.stringify(statsData, null, 2);
+    const dataBlob = new Blob([dataStr], {type: 'application/json'});
+    const url = URL.createObjectURL(dataBlob);
+    const link = document.createElement('a');
+    link.href = url;
+    link.download = 'jamie-ai-stats-' + new Date().toISOString().split('T')[0] + '.json';
+    link.click();
+}
+
+// Initialize page
+document.getElementById('lastUpdate').textContent = new Date().toLocaleString();
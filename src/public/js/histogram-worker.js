@@ -0,0 +1,20 @@
+// Bins response times for the benchmarks page chart off the main thread.
+// Message in:  {id, values: number[], bins}
+// Message out: {id, histogram: number[], maxTime, maxCount, binSize}
+self.onmessage = (e) => {
+    const {id, values, bins} = e.data;
+    let maxTime = 0;
+    for (const value of values) {
+        if (value > maxTime) maxTime = value;
+    }
+    const binSize = maxTime / bins;
+    const histogram = new Array(bins).fill(0);
+    for (const value of values) {
+        histogram[Math.min(Math.floor(value / binSize), bins - 1)]++;
+    }
+    let maxCount = 0;
+    for (const count of histogram) {
+        if (count > maxCount) maxCount = count;
+    }
+    self.postMessage({id, histogram, maxTime, maxCount, binSize});
+};
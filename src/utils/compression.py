@@ -0,0 +1,24 @@
+"""
+Response compression shared by the legacy and modular servers.
+
+Wraps Starlette's GZipMiddleware so token/log streaming routes are left
+uncompressed - gzip would otherwise hold their chunks in its buffer.
+"""
+from fastapi.middleware.gzip import GZipMiddleware
+
+
+class SelectiveGZipMiddleware(GZipMiddleware):
+    """GZipMiddleware that leaves streaming routes uncompressed so each chunk flushes immediately.
+
+    Responses that already carry a Content-Encoding (the precompressed pages) pass through untouched.
+    """
+
+    def __init__(self, app, skip_prefixes: tuple = (), **kwargs):
+        super().__init__(app, **kwargs)
+        self.skip_prefixes = skip_prefixes
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"].startswith(self.skip_prefixes):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
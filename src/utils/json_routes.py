@@ -0,0 +1,41 @@
+"""
+Request body decoding shared by the legacy and modular servers.
+
+Routes built with ORJSONRoute hand their handlers an ORJSONRequest, whose
+``await request.json()`` decodes the raw body with orjson (when installed)
+instead of the stdlib json module - the FastAPI custom route class recipe.
+"""
+import json
+from typing import Any, Callable, Coroutine
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # optional - falls back to stdlib json
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so existing error handling still applies
+json_loads = orjson.loads if orjson is not None else json.loads
+
+
+class ORJSONRequest(Request):
+    """Request whose json() is decoded with orjson, once per request."""
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            self._json = json_loads(await self.body())
+        return self._json
+
+
+class ORJSONRoute(APIRoute):
+    """APIRoute that passes ORJSONRequest to its endpoint."""
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+
+        async def orjson_route_handler(request: Request) -> Response:
+            return await handler(ORJSONRequest(request.scope, request.receive))
+
+        return orjson_route_handler
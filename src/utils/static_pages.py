@@ -0,0 +1,137 @@
+"""
+Static HTML pages served from memory.
+
+Pages are read from disk once, precompressed with gzip (and brotli when
+installed) and served with Accept-Encoding negotiation and an ETag, so a
+page hit is just a bytes lookup (or a 304) instead of re-encoding a large
+string per request.
+
+Dashboard pages can also carry a JSON payload inlined at an ``<!--INIT-->``
+marker, so their first paint does not wait on a second fetch.
+
+Asset directories (logos, page scripts) are mounted with CachedStaticFiles,
+which marks them immutable and tags them with a content-hash ETag.
+"""
+import gzip
+import hashlib
+import os
+import stat
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from fastapi import Request
+from fastapi.responses import FileResponse, Response
+from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
+from starlette.staticfiles import NotModifiedResponse
+
+try:
+    import brotli
+except ImportError:
+    brotli = None  # optional - gzip only
+
+# Extracted HTML pages live alongside the modular frontend
+FRONTEND_HTML_DIR = Path(__file__).parent.parent / "frontend" / "html"
+
+# Where render() inlines its JSON payload
+INIT_MARKER = b"<!--INIT-->"
+
+
+class StaticPage:
+    """An HTML page kept in memory as raw, gzip and brotli bytes."""
+
+    def __init__(self, path: Path, media_type: str = "text/html; charset=utf-8"):
+        self.path = Path(path)
+        self.media_type = media_type
+        self.body: bytes = self.path.read_bytes()
+        self.gzip_body: bytes = gzip.compress(self.body, 9)
+        self.br_body: Optional[bytes] = brotli.compress(self.body) if brotli is not None else None
+        self.etag = '"' + hashlib.blake2b(self.body, digest_size=8).hexdigest() + '"'
+        # Last render(): (payload, etag, raw, gzip, brotli)
+        self._rendered: Optional[tuple] = None
+
+    def response(self, request: Request) -> Response:
+        """Return 304 if the client copy is current, else the best encoding it accepts."""
+        return self._respond(request, self.etag, self.body, self.gzip_body, self.br_body)
+
+    def render(self, request: Request, payload: bytes) -> Response:
+        """Serve the page with a JSON payload inlined as <script id="__INIT__">.
+
+        The encoded page is kept for the most recent payload, so repeat loads
+        of an unchanged dashboard are served like a static page.
+        """
+        rendered = self._rendered
+        if rendered is None or rendered[0] is not payload:
+            # "<" only occurs inside JSON strings, where \u003c is equivalent and cannot end the script
+            script = (b'<script id="__INIT__" type="application/json">'
+                      + payload.replace(b"<", b"\\u003c") + b"</script>")
+            body = self.body.replace(INIT_MARKER, script, 1)
+            etag = '"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"'
+            rendered = (payload, etag, body, gzip.compress(body, 6),
+                        brotli.compress(body, quality=5) if brotli is not None else None)
+            self._rendered = rendered
+        return self._respond(request, *rendered[1:])
+
+    def _respond(self, request: Request, etag: str, body: bytes, gzip_body: bytes,
+                 br_body: Optional[bytes]) -> Response:
+        # no-cache: browsers keep the page but revalidate it with If-None-Match
+        headers = {"ETag": etag, "Vary": "Accept-Encoding", "Cache-Control": "no-cache"}
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=headers)
+
+        accept_encoding = request.headers.get("accept-encoding", "")
+
+        if br_body is not None and "br" in accept_encoding:
+            headers["Content-Encoding"] = "br"
+            body = br_body
+        elif "gzip" in accept_encoding:
+            headers["Content-Encoding"] = "gzip"
+            body = gzip_body
+
+        return Response(content=body, media_type=self.media_type, headers=headers)
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles whose responses browsers may cache for a year.
+
+    Assets never change under the same URL (scripts carry a ?v=N), so they are
+    marked immutable. The ETag is a hash of the file contents, computed once per
+    file and again only if its size or mtime changes, so revalidations after a
+    redeploy are 304s unless the bytes really differ. Hashing happens in
+    lookup_path, which Starlette already runs in a worker thread, so the event
+    loop never reads the file.
+    """
+
+    def __init__(self, *args, cache_control: str = "public, max-age=31536000, immutable", **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cache_control = cache_control
+        # path -> (mtime, size, ETag)
+        self._etags: Dict[str, Tuple[float, int, str]] = {}
+
+    def _cached_etag(self, full_path, stat_result: os.stat_result) -> Optional[str]:
+        cached = self._etags.get(str(full_path))
+        if cached is not None and cached[:2] == (stat_result.st_mtime, stat_result.st_size):
+            return cached[2]
+        return None
+
+    def lookup_path(self, path: str) -> Tuple[str, Optional[os.stat_result]]:
+        full_path, stat_result = super().lookup_path(path)
+        if (stat_result is not None and stat.S_ISREG(stat_result.st_mode)
+                and self._cached_etag(full_path, stat_result) is None):
+            digest = hashlib.blake2b(digest_size=12)
+            with open(full_path, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 16), b""):
+                    digest.update(chunk)
+            self._etags[str(full_path)] = (stat_result.st_mtime, stat_result.st_size,
+                                           '"' + digest.hexdigest() + '"')
+        return full_path, stat_result
+
+    def file_response(self, full_path, stat_result: os.stat_result, scope, status_code: int = 200) -> Response:
+        response = FileResponse(full_path, status_code=status_code, stat_result=stat_result)
+        etag = self._cached_etag(full_path, stat_result)
+        if etag is not None:  # otherwise keep FileResponse's stat-based ETag
+            response.headers["etag"] = etag
+        response.headers["cache-control"] = self.cache_control
+        if self.is_not_modified(response.headers, Headers(scope=scope)):
+            return NotModifiedResponse(response.headers)
+        return response
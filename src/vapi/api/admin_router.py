@@ -21,6 +21,8 @@ import asyncio
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from utils.logger import logger
+from utils.json_routes import ORJSONRoute
+from utils.static_pages import StaticPage, FRONTEND_HTML_DIR
 from ai.model_manager import ModelManager
 from config.model_settings import model_settings
 from vapi.models.webhook_models import SystemStatus
@@ -30,12 +32,21 @@ class AdminRouter:
     """Router class for admin endpoints"""
     
     def __init__(self, model_manager: ModelManager, runpod_api_key: str = None):
-        self.router = APIRouter(prefix="/admin", tags=["admin"])
+        self.router = APIRouter(prefix="/admin", tags=["admin"], route_class=ORJSONRoute)
         self.model_manager = model_manager
         self.runpod_api_key = runpod_api_key
         self.provider_service = ProviderService()
+        # Pages are read and precompressed once (ETag/304 on repeat loads); None falls back to a notice
+        self.admin_page = self._load_page("admin-ui.html")
+        self.config_page = self._load_page("system-config-ui.html")
         self._setup_routes()
     
+    @staticmethod
+    def _load_page(name: str):
+        """StaticPage for a frontend HTML file, or None if it is missing"""
+        path = FRONTEND_HTML_DIR / name
+        return StaticPage(path) if path.exists() else None
+    
     def _setup_routes(self):
         """Setup admin routes"""
         
@@ -43,13 +54,10 @@ class AdminRouter:
         async def admin_dashboard(request: Request):
             """Admin dashboard page - serve the existing frontend admin-ui.html"""
             try:
-                # Path to the existing frontend admin-ui.html
-                frontend_path = Path(__file__).parent.parent.parent / "frontend" / "html" / "admin-ui.html"
-                
-                if frontend_path.exists():
-                    with open(frontend_path, 'r', encoding='utf-8') as f:
-                        return f.read()
+                if self.admin_page is not None:
+                    return self.admin_page.response(request)
                 else:
+                    frontend_path = FRONTEND_HTML_DIR / "admin-ui.html"
                     # Fallback to a simple message if file doesn't exist
                     return '''
                     <!DOCTYPE html>
@@ -69,13 +77,10 @@ class AdminRouter:
         async def system_config_dashboard(request: Request):
             """System configuration dashboard page"""
             try:
-                # Path to the system config UI
-                config_path = Path(__file__).parent.parent.parent / "frontend" / "html" / "system-config-ui.html"
-                
-                if config_path.exists():
-                    with open(config_path, 'r', encoding='utf-8') as f:
-                        return f.read()
+                if self.config_page is not None:
+                    return self.config_page.response(request)
                 else:
+                    config_path = FRONTEND_HTML_DIR / "system-config-ui.html"
                     # Fallback to a simple message if file doesn't exist
                     return '''
                     <!DOCTYPE html>
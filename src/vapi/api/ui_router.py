@@ -17,6 +17,8 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from utils.logger import logger
+from utils.json_routes import ORJSONRoute
+from utils.static_pages import StaticPage, FRONTEND_HTML_DIR
 from ai.model_manager import ModelManager
 from config.model_settings import model_settings
 from vapi.services.provider_service import ProviderService
@@ -25,12 +27,15 @@ class UIRouter:
     """Router class for UI endpoints"""
     
     def __init__(self, model_manager: ModelManager):
-        self.router = APIRouter(tags=["ui"])
+        self.router = APIRouter(tags=["ui"], route_class=ORJSONRoute)
         self.model_manager = model_manager
         self.provider_service = ProviderService()
         
         # Get paths to frontend assets
         self.frontend_dir = Path(__file__).parent.parent.parent / "frontend"
+        # Read and precompressed once (ETag/304 on repeat loads); None falls back to a notice
+        main_ui = FRONTEND_HTML_DIR / "main-ui.html"
+        self.ui_page = StaticPage(main_ui) if main_ui.exists() else None
         
         self._setup_routes()
     
@@ -48,13 +53,10 @@ class UIRouter:
         async def ui_page(request: Request):
             """Main UI page - serve the existing frontend main-ui.html"""
             try:
-                # Path to the existing frontend main-ui.html
-                frontend_path = Path(__file__).parent.parent.parent / "frontend" / "html" / "main-ui.html"
-                
-                if frontend_path.exists():
-                    with open(frontend_path, 'r', encoding='utf-8') as f:
-                        return f.read()
+                if self.ui_page is not None:
+                    return self.ui_page.response(request)
                 else:
+                    frontend_path = FRONTEND_HTML_DIR / "main-ui.html"
                     # Fallback to a simple message if file doesn't exist
                     return '''
                     <!DOCTYPE html>
@@ -275,14 +277,14 @@ class UIRouter:
                 logger.info(f"🔄 UI STREAM [{request_id}] Starting - Model: {model_name}, Message: {message[:50]}...")
                 
                 # Check if model manager supports streaming
-                if hasattr(self.model_manager, 'generate_stream'):
+                if hasattr(self.model_manager, 'agenerate_stream'):
                     # Use streaming if available
-                    def token_iter():
+                    async def token_iter():
                         full_response = ""
                         token_count = 0
                         first_token_time = None
                         
-                        for token in self.model_manager.generate_stream(message, model_name=model_name):
+                        async for token in self.model_manager.agenerate_stream(message, model_name=model_name):
                             if first_token_time is None:
                                 first_token_time = time.time()
                             
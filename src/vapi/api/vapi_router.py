@@ -10,6 +10,8 @@ from fastapi import APIRouter, Request, HTTPException, Depends, Header
 from fastapi.responses import JSONResponse, StreamingResponse
 from typing import Dict, Any, Annotated, List
 from datetime import datetime
+import asyncio
+import json
 import time
 from pathlib import Path
 import sys
@@ -18,6 +20,7 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from utils.logger import logger
+from utils.json_routes import ORJSONRoute
 from ai.model_manager import ModelManager
 from config.model_settings import model_settings
 from vapi.models.webhook_models import (
@@ -26,14 +29,22 @@ from vapi.models.webhook_models import (
 )
 from vapi.services.provider_service import ProviderService
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # optional - falls back to stdlib json
+
 class VAPIRouter:
     """Router class for VAPI endpoints"""
     
     def __init__(self, model_manager: ModelManager, vapi_api_key: str):
-        self.router = APIRouter(prefix="/vapi", tags=["vapi"])
+        self.router = APIRouter(prefix="/vapi", tags=["vapi"], route_class=ORJSONRoute)
         self.model_manager = model_manager
         self.vapi_api_key = vapi_api_key
         self.provider_service = ProviderService()
+        # Benchmark lines go to logs/benchmark_<date>.jsonl; the directory is created once here
+        self._logs_dir = Path("logs")
+        self._logs_dir.mkdir(exist_ok=True)
         self._setup_routes()
     
     def verify_vapi_auth(self, authorization: Annotated[str, Header()] = None):
@@ -241,8 +252,6 @@ class VAPIRouter:
         @self.router.post("/test/stream")
         async def test_stream(request: Request):
             """Stream AI response token-by-token (chunked plain text)."""
-            import json
-            
             start_time = time.time()
             request_id = f"req_{int(start_time)}_{hash(time.time()) % 10000}"
             
@@ -261,10 +270,10 @@ class VAPIRouter:
                 token_count = 0
                 first_token_time = None
 
-                def token_iter():
+                async def token_iter():
                     nonlocal full_response, token_count, first_token_time
                     
-                    for token in self.model_manager.generate_stream(message, model_name=model_name):
+                    async for token in self.model_manager.agenerate_stream(message, model_name=model_name):
                         if first_token_time is None:
                             first_token_time = time.time()
                         
@@ -309,8 +318,8 @@ class VAPIRouter:
                     logger.info(f"📊 BENCHMARK [{request_id}] Complete - Duration: {total_duration:.2f}s, Tokens: {token_count}, TPS: {tokens_per_second:.2f}")
                     logger.info(f"📝 BENCHMARK [{request_id}] Response: {full_response[:100]}...")
                     
-                    # Save to benchmark log file
-                    self._save_benchmark_data(benchmark_data)
+                    # Save to benchmark log file (blocking file I/O, so off the event loop)
+                    await asyncio.to_thread(self._save_benchmark_data, benchmark_data)
                 
                 return StreamingResponse(token_iter(), media_type='text/plain')
                 
@@ -476,21 +485,17 @@ class VAPIRouter:
     
     def _save_benchmark_data(self, benchmark_data: dict):
         """Save benchmark data to log file for analysis"""
-        import json
-        import os
-        from pathlib import Path
-        
         try:
-            # Ensure logs directory exists
-            logs_dir = Path("logs")
-            logs_dir.mkdir(exist_ok=True)
-            
             # Create benchmark log file with date
-            log_file = logs_dir / f"benchmark_{time.strftime('%Y-%m-%d')}.jsonl"
+            log_file = self._logs_dir / f"benchmark_{time.strftime('%Y-%m-%d')}.jsonl"
             
-            # Append benchmark data as JSON line
-            with open(log_file, 'a', encoding='utf-8') as f:
-                f.write(json.dumps(benchmark_data) + '\n')
+            # Append benchmark data as JSON line (orjson encodes straight to bytes)
+            if orjson is not None:
+                line = orjson.dumps(benchmark_data, default=str) + b'\n'
+            else:
+                line = (json.dumps(benchmark_data, default=str) + '\n').encode('utf-8')
+            with open(log_file, 'ab') as f:
+                f.write(line)
                 
             logger.info(f"💾 SAVED BENCHMARK: {benchmark_data['model']} - {benchmark_data['performance']['total_duration_ms']}ms")
                 
@@ -7,24 +7,38 @@ Refactored webhook server using modular routers and services.
 This replaces the monolithic webhook_server.py with a clean, modular structure.
 """
 
+import importlib.util
 import os
 import sys
 from pathlib import Path
 from fastapi import FastAPI, Request
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, JSONResponse, ORJSONResponse
 import uvicorn
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from utils.logger import logger
+from utils.compression import SelectiveGZipMiddleware
+from utils.static_pages import CachedStaticFiles
 from ai.model_manager import ModelManager
 from vapi.api.vapi_router import create_vapi_router
 from vapi.api.admin_router import create_admin_router
 from vapi.api.ui_router import create_ui_router
 from vapi.api.system_config_router import create_system_config_router
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # optional - falls back to stdlib json
+
+# Routes that stream tokens/log lines as plain text; gzip would hold chunks back
+STREAMING_PATH_PREFIXES = (
+    "/test/stream",
+    "/vapi/test/stream",
+    "/admin/train-jamie",
+)
+
 class ModularVAPIServer:
     """Modular VAPI Server with clean separation of concerns"""
     
@@ -33,7 +47,9 @@ class ModularVAPIServer:
         self.app = FastAPI(
             title="VAPI AI Assistant - Modular",
             version="2.0.0",
-            description="Modular VAPI webhook server with clean architecture"
+            description="Modular VAPI webhook server with clean architecture",
+            # Router return values are encoded with orjson when available
+            default_response_class=ORJSONResponse if orjson is not None else JSONResponse
         )
         
         # Initialize services
@@ -41,6 +57,10 @@ class ModularVAPIServer:
         self.vapi_api_key = os.getenv("VAPI_API_KEY", "your-vapi-key-here")
         self.runpod_api_key = os.getenv("RUNPOD_API_KEY")
         
+        # Compress the admin/UI HTML and JSON responses; streaming routes pass through
+        self.app.add_middleware(SelectiveGZipMiddleware, skip_prefixes=STREAMING_PATH_PREFIXES,
+                                minimum_size=1024, compresslevel=5)
+        
         # Setup server
         self._setup_services()
         self._setup_static_files()
@@ -66,22 +86,23 @@ class ModularVAPIServer:
             frontend_dir = Path(__file__).parent.parent / "frontend"
             
             if frontend_dir.exists():
-                # Mount CSS and JS directories
+                # Mount CSS and JS directories. Their URLs aren't versioned, so browsers
+                # revalidate them (a 304 while the ETag matches) instead of caching blindly
                 css_dir = frontend_dir / "css"
                 js_dir = frontend_dir / "js"
                 
                 if css_dir.exists():
-                    self.app.mount("/css", StaticFiles(directory=str(css_dir)), name="css")
+                    self.app.mount("/css", CachedStaticFiles(directory=str(css_dir), cache_control="no-cache"), name="css")
                     logger.info(f"📁 Mounted CSS files from {css_dir}")
                 
                 if js_dir.exists():
-                    self.app.mount("/js", StaticFiles(directory=str(js_dir)), name="js")
+                    self.app.mount("/js", CachedStaticFiles(directory=str(js_dir), cache_control="no-cache"), name="js")
                     logger.info(f"📁 Mounted JS files from {js_dir}")
                 
-                # Mount public assets if they exist
+                # Mount public assets (logos) if they exist; cached by browsers for a year
                 public_dir = Path(__file__).parent.parent / "public"
                 if public_dir.exists():
-                    self.app.mount("/public", StaticFiles(directory=str(public_dir)), name="public")
+                    self.app.mount("/public", CachedStaticFiles(directory=str(public_dir)), name="public")
                     logger.info(f"📁 Mounted public files from {public_dir}")
             
         except Exception as e:
@@ -132,7 +153,8 @@ class ModularVAPIServer:
                 
                 for favicon_path in favicon_paths:
                     if favicon_path.exists():
-                        return FileResponse(favicon_path, media_type="image/png")
+                        return FileResponse(favicon_path, media_type="image/png",
+                                            headers={"Cache-Control": "public, max-age=31536000, immutable"})
                 
                 # If no favicon found, return 404
                 from fastapi import HTTPException
@@ -183,10 +205,17 @@ class ModularVAPIServer:
         logger.info("   🤖 VAPI: http://localhost:8000/vapi/*")
         logger.info("   ❤️ Health: http://localhost:8000/health")
         
+        # WEB_CONCURRENCY worker processes (not with --debug's reloader); multiple workers need
+        # an importable app, so they go through create_app()
+        workers = 1 if debug else int(os.getenv("WEB_CONCURRENCY", "1"))
         uvicorn.run(
-            self.app,
+            "vapi.modular_server:create_app" if workers > 1 else self.app,
+            factory=workers > 1,
             host=host,
             port=port,
+            loop="uvloop" if importlib.util.find_spec("uvloop") else "asyncio",
+            http="httptools" if importlib.util.find_spec("httptools") else "h11",
+            workers=workers,
             log_level="info" if not debug else "debug",
             reload=debug
         )
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Test HTTP Utilities
+Covers the request decoding, static page and compression helpers in src/utils
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path to import modules
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+pytest.importorskip("fastapi")
+
+from fastapi import FastAPI, Request
+from fastapi.responses import PlainTextResponse
+from fastapi.testclient import TestClient
+
+from utils.compression import SelectiveGZipMiddleware
+from utils.json_routes import ORJSONRoute
+from utils.static_pages import INIT_MARKER, CachedStaticFiles, StaticPage, brotli
+
+PAGE_HTML = b"<html><body>" + b"<p>Pete dashboard</p>" * 200 + INIT_MARKER + b"</body></html>"
+
+
+@pytest.fixture
+def page(tmp_path):
+    path = tmp_path / "page.html"
+    path.write_bytes(PAGE_HTML)
+    return StaticPage(path)
+
+
+@pytest.fixture
+def page_client(page):
+    app = FastAPI()
+
+    @app.get("/page")
+    async def serve_page(request: Request):
+        return page.response(request)
+
+    @app.get("/rendered")
+    async def serve_rendered(request: Request):
+        return page.render(request, b'{"note": "</script><b>"}')
+
+    return TestClient(app)
+
+
+def test_orjson_route_rejects_malformed_body():
+    """A body that is not JSON is a 422, not a 500"""
+    app = FastAPI()
+    app.router.route_class = ORJSONRoute
+
+    @app.post("/echo")
+    async def echo(payload: dict):
+        return payload
+
+    client = TestClient(app)
+    assert client.post("/echo", json={"a": 1}).json() == {"a": 1}
+    response = client.post("/echo", content=b"{not json", headers={"content-type": "application/json"})
+    assert response.status_code == 422
+
+
+def test_static_page_etag_and_304(page_client):
+    response = page_client.get("/page")
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "no-cache"
+    etag = response.headers["etag"]
+
+    revalidated = page_client.get("/page", headers={"if-none-match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+
+
+def test_static_page_gzip_negotiation(page_client, page):
+    response = page_client.get("/page", headers={"accept-encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.content == PAGE_HTML  # httpx decodes the gzip body
+    assert len(page.gzip_body) < len(PAGE_HTML)
+
+    identity = page_client.get("/page", headers={"accept-encoding": "identity"})
+    assert "content-encoding" not in identity.headers
+    assert identity.content == PAGE_HTML
+
+
+@pytest.mark.skipif(brotli is None, reason="brotli not installed")
+def test_static_page_prefers_brotli(page_client, page):
+    response = page_client.get("/page", headers={"accept-encoding": "gzip, br"})
+    assert response.headers["content-encoding"] == "br"
+    assert brotli.decompress(page.br_body) == PAGE_HTML
+
+
+def test_render_escapes_payload(page_client):
+    """The inlined payload can't close its <script> tag"""
+    response = page_client.get("/rendered")
+    body = response.content
+    assert INIT_MARKER not in body
+    assert b'<script id="__INIT__" type="application/json">' in body
+    assert b"\\u003c/script>\\u003cb>" in body
+    assert body.count(b"</script>") == 1
+
+    etag = response.headers["etag"]
+    assert page_client.get("/rendered", headers={"if-none-match": etag}).status_code == 304
+
+
+def test_cached_static_files_304(tmp_path):
+    (tmp_path / "app.js").write_text("console.log('pete');")
+    app = FastAPI()
+    app.mount("/public", CachedStaticFiles(directory=str(tmp_path)), name="public")
+    client = TestClient(app)
+
+    response = client.get("/public/app.js")
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "public, max-age=31536000, immutable"
+    etag = response.headers["etag"]
+
+    assert client.get("/public/app.js", headers={"if-none-match": etag}).status_code == 304
+    assert client.get("/public/missing.js").status_code == 404
+
+
+def test_selective_gzip_skips_prefixes():
+    text = "token " * 500
+    app = FastAPI()
+    app.add_middleware(SelectiveGZipMiddleware, skip_prefixes=("/test/stream",), minimum_size=100)
+
+    @app.get("/test/stream")
+    async def stream():
+        return PlainTextResponse(text)
+
+    @app.get("/report")
+    async def report():
+        return PlainTextResponse(text)
+
+    client = TestClient(app)
+    headers = {"accept-encoding": "gzip"}
+    assert "content-encoding" not in client.get("/test/stream", headers=headers).headers
+    compressed = client.get("/report", headers=headers)
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert compressed.text == text
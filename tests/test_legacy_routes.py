@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Test Legacy Server Routes
+Verifies that every endpoint defined in setup_routes is actually registered
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory and src to path to import modules
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "src"))
+
+pytest.importorskip("fastapi")
+pytest.importorskip("langchain_community")
+
+from fastapi.testclient import TestClient
+
+EXPECTED_ROUTES = [
+    ("GET", "/"),
+    ("GET", "/health"),
+    ("POST", "/train/pm"),
+    ("POST", "/vapi/webhook"),
+    ("POST", "/test/message"),
+    ("POST", "/test/batch"),
+    ("POST", "/test/stream"),
+    ("GET", "/ui"),
+    ("GET", "/admin"),
+    ("GET", "/admin/model-status"),
+    ("GET", "/admin/model-status/stream"),
+    ("POST", "/admin/test-model"),
+    ("POST", "/admin/test-model/batch"),
+    ("GET", "/admin/benchmarks"),
+    ("GET", "/admin/api/dashboard"),
+    ("GET", "/admin/stats"),
+]
+
+
+@pytest.fixture(scope="module")
+def server(tmp_path_factory):
+    """Build the legacy server from a scratch directory so its logs/db stay out of the repo"""
+    os.environ.setdefault("RUNPOD_API_KEY", "test-key")
+    os.environ.setdefault("RUNPOD_SERVERLESS_ENDPOINT", "test-endpoint")
+    cwd = os.getcwd()
+    os.chdir(tmp_path_factory.mktemp("legacy"))
+    try:
+        from vapi.webhook_server_legacy import VAPIWebhookServer
+        server = VAPIWebhookServer()
+        with TestClient(server.app) as client:
+            yield server, client
+    finally:
+        os.chdir(cwd)
+
+
+def test_routes_registered(server):
+    """Routes after _get_fallback_openrouter_models must still be on the app"""
+    server, _ = server
+    registered = {
+        (method, route.path)
+        for route in server.app.routes
+        for method in getattr(route, "methods", None) or ()
+    }
+    missing = [route for route in EXPECTED_ROUTES if route not in registered]
+    assert not missing, f"Routes not registered: {missing}"
+
+
+def test_batch_requires_messages(server):
+    """/test/batch rejects an empty batch before touching a model"""
+    _, client = server
+    response = client.post("/test/batch", json={"messages": []})
+    assert response.status_code == 400
+
+
+def test_webhook_ignores_unhandled_header_event(server):
+    """Header-typed events we don't handle are acknowledged without a body"""
+    _, client = server
+    response = client.post("/vapi/webhook", headers={"x-vapi-event": "speech-update"})
+    assert response.status_code == 200
+    assert response.json() == {"status": "ignored"}
+
+
+def test_benchmark_stream_pages_through_shared_timestamps(server, monkeypatch):
+    """Rows written in the same second are neither skipped nor repeated across pages"""
+    pd = pytest.importorskip("pandas")
+    server, client = server
+    rows = pd.DataFrame({
+        "request_id": [f"req_{i}" for i in range(5)],
+        "timestamp": pd.to_datetime(["2026-10-17 14:00:01"] * 3 + ["2026-10-17 14:00:00"] * 2),
+        "model": ["llama3:latest"] * 5,
+    })
+    monkeypatch.setattr(server, "_filtered_benchmarks", lambda *args: rows)
+
+    seen, params = [], {"limit": 2}
+    while True:
+        response = client.get("/admin/api/benchmarks/stream", params=params)
+        assert response.status_code == 200
+        seen += [json.loads(line)["request_id"] for line in response.text.splitlines()]
+        if "x-next-cursor" not in response.headers:
+            break
+        params = {"limit": 2, "before": response.headers["x-next-cursor"],
+                  "before_id": response.headers["x-next-cursor-id"]}
+
+    assert seen == ["req_2", "req_1", "req_0", "req_4", "req_3"]